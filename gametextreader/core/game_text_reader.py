@@ -3,7 +3,6 @@ Main GameTextReader class - handles OCR, TTS, hotkeys, and GUI
 """
 import asyncio
 import datetime
-import io
 import json
 import os
 import random
@@ -58,7 +57,7 @@ from ..utils import (
 from ..screen_capture import capture_screen_area, get_primary_monitor_info
 from ..update_checker import check_for_update
 from .controller_handler import ControllerHandler, CONTROLLER_AVAILABLE
-from ..windows.console_window import ConsoleWindow
+from ..windows.console_window import ConsoleWindow, LogBuffer
 from ..windows.image_processing_window import ImageProcessingWindow
 from ..windows.game_units_edit_window import GameUnitsEditWindow
 from ..windows.text_log_window import TextLogWindow
@@ -470,8 +469,8 @@ class GameTextReader:
         self.edit_area_alpha = 0.95  # Default value
         self.edit_area_hotkey_mock_button = None  # Reference to mock button for hotkey registration
         
-        # Initialize log buffer for console window
-        self.log_buffer = io.StringIO()
+        # Initialize log buffer for console window (keeps only the most recent lines)
+        self.log_buffer = LogBuffer()
 
         # Ensure InputManager is enabled at startup
         InputManager.allow()
@@ -482,7 +481,7 @@ class GameTextReader:
         if not hasattr(sys, 'stdout_original'):
             sys.stdout_original = sys.stdout
         
-        self.console_window = ConsoleWindow(self.root, self.log_buffer, self.layout_file, self.latest_images, self.latest_area_name)
+        self.console_window = ConsoleWindow(self.root, self.log_buffer, self.layout_file, self.latest_images, self.latest_area_name, self)
         self.console_window.window.withdraw()  # Hide the window initially
         sys.stdout = self.console_window
         
@@ -892,6 +891,18 @@ class GameTextReader:
             print(f"Warning: Could not get SAPI voices: {e}")
             self.voices = []
         
+        # Voice descriptions, fetched once - each GetDescription() is a COM call. The lookup
+        # keeps the first voice for a description, like a linear search over self.voices would
+        self._voice_descriptions = []
+        for voice in self.voices:
+            try:
+                self._voice_descriptions.append(voice.GetDescription())
+            except Exception:
+                self._voice_descriptions.append("")
+        self._voice_by_description = {}
+        for description, voice in zip(self._voice_descriptions, self.voices):
+            self._voice_by_description.setdefault(description, voice)
+        
         self.stop_keyboard_hook = None
         self.stop_mouse_hook = None
         self.setting_hotkey_mouse_hook = None
@@ -4562,8 +4573,7 @@ class GameTextReader:
             if self.console_window.window.state() == 'withdrawn':
                 self.console_window.window.deiconify()
                 self.console_window.window.lift()
-                self.console_window.window.focus_force()
-                self.console_window.update_console()  # Refresh the display
+                self.console_window.window.focus_force()  # Mapping the window refreshes its display
             else:
                 self.console_window.window.withdraw()
         else:
@@ -4571,7 +4581,7 @@ class GameTextReader:
             if not hasattr(sys, 'stdout_original'):
                 sys.stdout_original = sys.stdout
             
-            self.console_window = ConsoleWindow(self.root, self.log_buffer, self.layout_file, self.latest_images, self.latest_area_name)
+            self.console_window = ConsoleWindow(self.root, self.log_buffer, self.layout_file, self.latest_images, self.latest_area_name, self)
             sys.stdout = self.console_window
         
     def customize_processing(self, area_name_var):
@@ -12899,6 +12909,8 @@ class GameTextReader:
         os.makedirs(temp_path, exist_ok=True)
         
         file_path = os.path.join(temp_path, 'gamer_units.json')
+        # Whether gamer_units.json on disk holds the returned units (parsed, or freshly written defaults)
+        self._game_units_file_ok = False
         if os.path.exists(file_path):
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
@@ -12909,7 +12921,9 @@ class GameTextReader:
                     # Remove multi-line comments (/* ... */)
                     content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
                     # Parse the cleaned JSON
-                    return json.loads(content)
+                    units = json.loads(content)
+                    self._game_units_file_ok = True
+                    return units
             except (json.JSONDecodeError, UnicodeDecodeError) as e:
                 print(f"Warning: Error reading game units file: {e}")
                 # Prompt user to create new default file
@@ -13009,6 +13023,7 @@ class GameTextReader:
             f.write(header)
             json.dump(default_units, f, indent=4, ensure_ascii=False)
         
+        self._game_units_file_ok = True
         return default_units
 
     def save_game_units(self):
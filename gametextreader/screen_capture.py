@@ -89,14 +89,10 @@ def get_primary_monitor_info():
                win32api.GetSystemMetrics(win32con.SM_CYSCREEN))
 
 
-def capture_screen_area(x1, y1, x2, y2, use_printwindow=False, target_hwnd=None):
+def _clamp_to_virtual_screen(x1, y1, x2, y2):
     """
-    Capture screen area across multiple monitors using win32api.
-    
-    Args:
-        x1, y1, x2, y2: Screen coordinates for the area to capture
-        use_printwindow: If True, try to use PrintWindow API (better for fullscreen apps)
-        target_hwnd: Window handle to capture from (for PrintWindow mode)
+    Clamp an area to the virtual screen (all monitors).
+    Returns: (x1, y1, x2, y2, width, height) with x1 <= x2 and y1 <= y2.
     """
     # Get virtual screen bounds
     min_x = win32api.GetSystemMetrics(win32con.SM_XVIRTUALSCREEN)  # Leftmost x (can be negative)
@@ -115,8 +111,85 @@ def capture_screen_area(x1, y1, x2, y2, use_printwindow=False, target_hwnd=None)
     # Ensure valid area (swap if necessary and check size)
     x1, x2 = min(x1, x2), max(x1, x2)
     y1, y2 = min(y1, y2), max(y1, y2)
-    width = x2 - x1
-    height = y2 - y1
+    return x1, y1, x2, y2, x2 - x1, y2 - y1
+
+
+class ScreenAreaGrabber:
+    """
+    Repeated BitBlt capture of one screen area, for callers that poll the same area.
+    
+    capture_screen_area() creates and destroys a desktop DC, a memory DC and a bitmap on
+    every call. This keeps them between grabs and only recreates them when the area size
+    changes. Call close() (or drop the object) to release the GDI handles.
+    """
+    
+    def __init__(self):
+        self._hwin = None
+        self._hwindc = None
+        self._srcdc = None
+        self._memdc = None
+        self._bmp = None
+        self._size = None
+    
+    def grab(self, x1, y1, x2, y2):
+        """Capture the area and return it as a PIL RGB image (same result as capture_screen_area)"""
+        x1, y1, x2, y2, width, height = _clamp_to_virtual_screen(x1, y1, x2, y2)
+        if width <= 0 or height <= 0:
+            return Image.new('RGB', (1, 1))  # Return a blank 1x1 image for invalid areas
+        
+        try:
+            if self._size != (width, height):
+                self.close()
+                self._hwin = win32gui.GetDesktopWindow()
+                self._hwindc = win32gui.GetWindowDC(self._hwin)
+                self._srcdc = win32ui.CreateDCFromHandle(self._hwindc)
+                self._memdc = self._srcdc.CreateCompatibleDC()
+                self._bmp = win32ui.CreateBitmap()
+                self._bmp.CreateCompatibleBitmap(self._srcdc, width, height)
+                self._memdc.SelectObject(self._bmp)
+                self._size = (width, height)
+            
+            # Copy screen into the reused bitmap
+            self._memdc.BitBlt((0, 0), (width, height), self._srcdc, (x1, y1), win32con.SRCCOPY)
+            bmpstr = self._bmp.GetBitmapBits(True)
+            return Image.frombuffer('RGB', (width, height), bmpstr, 'raw', 'BGRX', 0, 1)
+        except Exception:
+            # The handles may be stale (e.g. after a display change) - start fresh next grab
+            self.close()
+            raise
+    
+    def close(self):
+        """Release the GDI handles (a later grab() recreates them)"""
+        try:
+            if self._memdc:
+                self._memdc.DeleteDC()
+            if self._bmp:
+                win32gui.DeleteObject(self._bmp.GetHandle())
+            if self._hwindc:
+                win32gui.ReleaseDC(self._hwin, self._hwindc)
+        except Exception:
+            pass
+        self._hwin = None
+        self._hwindc = None
+        self._srcdc = None
+        self._memdc = None
+        self._bmp = None
+        self._size = None
+    
+    def __del__(self):
+        self.close()
+
+
+def capture_screen_area(x1, y1, x2, y2, use_printwindow=False, target_hwnd=None):
+    """
+    Capture screen area across multiple monitors using win32api.
+    
+    Args:
+        x1, y1, x2, y2: Screen coordinates for the area to capture
+        use_printwindow: If True, try to use PrintWindow API (better for fullscreen apps)
+        target_hwnd: Window handle to capture from (for PrintWindow mode)
+    """
+    x1, y1, x2, y2, width, height = _clamp_to_virtual_screen(x1, y1, x2, y2)
     if width <= 0 or height <= 0:
         return Image.new('RGB', (1, 1))  # Return a blank 1x1 image for invalid areas
 
@@ -1,19 +1,111 @@
 """
 Debug console window for viewing logs and processed images
 """
+import collections
 import datetime
 import os
+import queue
 import re
+import sys
+import time
+import traceback
+import weakref
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, messagebox
 from PIL import Image, ImageTk
 
-# Maximum buffer size to prevent memory issues (10MB)
-MAX_LOG_BUFFER_SIZE = 10 * 1024 * 1024
+from ..image_processing import preprocess_image
+
+# Milliseconds between moves of queued log writes into the buffer and text widget
+_LOG_DRAIN_INTERVAL_MS = 50
+
+# Minimum seconds between log-triggered image refreshes (caps them at 10 per second)
+_IMAGE_UPDATE_INTERVAL = 0.1
+
+# Milliseconds to wait after a Scale/Quality change before redrawing (only the last change renders)
+_VIEW_OPTION_DEBOUNCE_MS = 100
+
+# Milliseconds between checks for a finished background resize
+_RESIZE_POLL_MS = 10
+
+# Processed preview images kept per area (different settings / source frames)
+_PROCESSED_CACHE_SIZE = 8
+
+# Resampling filters for the image preview, fastest first
+RESAMPLE_FILTERS = {
+    'Fast': Image.Resampling.NEAREST,
+    'Good': Image.Resampling.BILINEAR,
+    'Best': Image.Resampling.LANCZOS,
+}
+
+# Number of log lines kept in memory and shown in the console
+MAX_CONSOLE_LINES = 250
+
+# URLs to make clickable - http://, https://, and www.
+_URL_PATTERN = r'https?://[^\s<>"{}|\\^`\[\]]+|www\.[^\s<>"{}|\\^`\[\]]+'
+_URL_RE = re.compile(_URL_PATTERN)
+# [BOLD]...[/BOLD] spans and URLs, found in a single pass over the text
+_TOKEN_RE = re.compile(r'(?P<bold>\[BOLD\](?P<bold_text>.*?)\[/BOLD\])|(?P<url>' + _URL_PATTERN + ')', re.DOTALL)
+
+
+class LogBuffer:
+    """
+    Bounded in-memory log that keeps only the last max_lines lines.
+    
+    Lines live in a deque, so appending is O(1) and memory stays bounded without
+    ever re-splitting the whole log. write() and getvalue() work like io.StringIO;
+    tail() reads only new text, iterating yields the lines and clear() empties the log.
+    """
+    
+    def __init__(self, max_lines=MAX_CONSOLE_LINES):
+        self._lines = collections.deque(maxlen=max_lines)  # Complete lines, each ending in '\n'
+        self._partial = ''  # Text written after the last newline
+        self.total_written = 0  # Characters ever written - lets readers find what's new
+    
+    def write(self, message):
+        self.total_written += len(message)
+        lines = (self._partial + message).split('\n')
+        self._partial = lines.pop()
+        self._lines.extend(line + '\n' for line in lines)
+        return len(message)
+    
+    def getvalue(self):
+        return ''.join(self._lines) + self._partial
+    
+    def __iter__(self):
+        """Yield the held text piece by piece (whole lines, then any partial line)"""
+        yield from self._lines
+        if self._partial:
+            yield self._partial
+    
+    def tail(self, count):
+        """Return the last count characters, or None if some of them already rolled out"""
+        parts = [self._partial]
+        size = len(self._partial)
+        for line in reversed(self._lines):
+            if size >= count:
+                break
+            parts.append(line)
+            size += len(line)
+        if size < count:
+            return None
+        text = ''.join(reversed(parts))
+        return text[len(text) - count:]
+    
+    def clear(self):
+        """Drop all held text (total_written keeps counting)"""
+        self._lines.clear()
+        self._partial = ''
 
 
 class ConsoleWindow:
-    def __init__(self, root, log_buffer, layout_file_var, latest_images, latest_area_name_var):
+    # Print image-preview diagnostics. Prints go back through write(), so keep this off
+    # unless debugging the preview itself
+    DEBUG = False
+    
+    def __init__(self, root, log_buffer, layout_file_var, latest_images, latest_area_name_var,
+                 game_text_reader=None):
         self.window = tk.Toplevel(root)
         self.window.title("Debug Console")
         
@@ -29,6 +121,7 @@ class ConsoleWindow:
             print(f"Error setting console window icon: {e}")
         
         self.latest_images = latest_images
+        self.game_text_reader = game_text_reader  # Source of original images and processing settings
         self.window.geometry("690x500")  # Initial size, will adjust based on image
 
         # Create a top frame for controls
@@ -52,9 +145,16 @@ class ConsoleWindow:
         tk.Label(scale_frame, text="Scale:").pack(side='left')
         self.scale_var = tk.StringVar(value="100")
         scales = [str(i) for i in range(10, 101, 10)]  # Creates ["10", "20", ..., "100"]
-        scale_menu = tk.OptionMenu(scale_frame, self.scale_var, *scales, command=self.update_image_display)
+        scale_menu = tk.OptionMenu(scale_frame, self.scale_var, *scales, command=self._on_view_option_changed)
         scale_menu.pack(side='left')
         tk.Label(scale_frame, text="%").pack(side='left')
+        
+        # Add resampling quality dropdown
+        tk.Label(scale_frame, text="Quality:").pack(side='left', padx=(10, 0))
+        self.resample_var = tk.StringVar(value="Best")
+        resample_menu = tk.OptionMenu(scale_frame, self.resample_var, *RESAMPLE_FILTERS,
+                                      command=self._on_view_option_changed)
+        resample_menu.pack(side='left')
 
         # Add Save Log button
         save_log_button = tk.Button(top_frame, text="Save Log", command=self.save_log)
@@ -91,17 +191,25 @@ class ConsoleWindow:
         # Configure URL tag style (blue underlined text)
         self.text_widget.tag_configure('url', foreground='blue', underline=1)
         
+        # Each link also gets its own url_N tag mapping to its exact text, since Tk's
+        # word boundaries stop at the dots and slashes inside a URL
+        self._urls = {}
+        self._url_seq = 0
+        
         # Bind click event for URLs
         def open_url(event):
             try:
                 import webbrowser
-                url = self.text_widget.get(tk.CURRENT + "wordstart", tk.CURRENT + "wordend")
+                url = next((self._urls[tag] for tag in self.text_widget.tag_names(tk.CURRENT)
+                            if tag in self._urls), None)
+                if not url:
+                    return
                 # Ensure URL has protocol
                 if url.startswith('www.'):
                     url = 'https://' + url
                 webbrowser.open(url)
             except Exception as e:
-                print(f"Error opening URL: {e}")
+                self._log_line(f"Error opening URL: {e}")
         
         self.text_widget.tag_bind('url', '<Button-1>', open_url)
         # Change cursor to hand when hovering over links
@@ -129,14 +237,50 @@ class ConsoleWindow:
         self.layout_file_var = layout_file_var
         self.latest_area_name_var = latest_area_name_var
         self.photo = None  # Keep a reference to prevent garbage collection
+        
+        # What the image label currently shows (weakref to the source image + area/scale/settings
+        # key) - weak, so the previous capture can be freed as soon as the app replaces it
+        self._last_render_source = None
+        self._last_render_key = None
+        self._last_geometry = None  # Last size set to fit the image
+        self._image_shown = False  # Whether image_label currently has an image
+        
+        # Preview resizes run on a worker thread (Pillow releases the GIL while resampling);
+        # only the newest request (_render_seq) is shown, older results are dropped
+        self._resize_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='console_resize')
+        self._render_seq = 0
+        self._pending_render = None  # (source image, render key) of the resize in flight
+        self._view_option_after_id = None  # Debounced redraw after a Scale/Quality change
+        
+        # preprocess_image results keyed by (id(source), settings) - the source is kept in
+        # the value so a recycled id() can never return a stale image
+        self._processed_cache = collections.OrderedDict()
+        self._processed_cache_area = None
 
         # Add line limit constant
-        self.MAX_LINES = 250
+        self.MAX_LINES = MAX_CONSOLE_LINES
+        
+        # log_buffer.total_written when text_widget was last updated (new writes are appended from here)
+        self._last_written = 0
+        
+        # write() may run on any thread, so it only queues the message; the Tk thread drains
+        # the queue every _LOG_DRAIN_INTERVAL_MS and updates the buffer and widgets in one batch
+        self._log_queue = queue.SimpleQueue()
+        
+        # A burst of writes schedules one image refresh for the next idle moment
+        self._image_update_pending = False
+        self._last_image_update = 0.0  # time.monotonic() of the last log-triggered image refresh
+        
+        # While the window is hidden, writes only go to log_buffer; it is redrawn when mapped
+        self._visible = False
+        self.window.bind('<Map>', self._on_map)
+        self.window.bind('<Unmap>', self._on_unmap)
         
         # Set up cleanup on window close
         self.window.protocol("WM_DELETE_WINDOW", self.on_close)
         
         self.update_console()
+        self._drain_log_queue()
     
     def on_close(self):
         """Hide the window instead of destroying it for reuse"""
@@ -146,7 +290,22 @@ class ConsoleWindow:
                 self.photo = None
         except Exception:
             pass
+        self._visible = False
         self.window.withdraw()  # Hide instead of destroy
+    
+    def _on_map(self, event):
+        """Window shown again - catch up on everything logged while it was hidden"""
+        if event.widget is not self.window or self._visible:
+            return
+        self._visible = True
+        self.update_console()
+        if self.show_image_var.get():
+            self._last_render_source = None  # Force a redraw, the photo may have been dropped
+            self.update_image_display()
+    
+    def _on_unmap(self, event):
+        if event.widget is self.window:
+            self._visible = False
 
     def show_context_menu(self, event):
         """Show the context menu at the mouse position."""
@@ -180,221 +339,323 @@ class ConsoleWindow:
         
         try:
             area_name = self.latest_area_name_var.get()
-            if self.show_image_var.get() and area_name in self.latest_images:
-                # Use original image if available, process it fresh to match preview window
-                from ..image_processing import preprocess_image
-                from ..core.game_text_reader import GameTextReader
-                
-                # Get the game_text_reader instance to access original images and settings
-                game_text_reader = None
-                
-                # Try multiple ways to find the game_text_reader instance
-                try:
-                    # Method 1: Look through top-level windows
-                    for widget in self.window.winfo_toplevel().winfo_children():
-                        if hasattr(widget, 'original_images'):
-                            game_text_reader = widget
-                            break
-                    
-                    # Method 2: If not found, try to get from the window's master
-                    if not game_text_reader and hasattr(self.window, 'master'):
-                        parent = self.window.master
-                        while parent:
-                            if hasattr(parent, 'original_images'):
-                                game_text_reader = parent
-                                break
-                            parent = parent.master
-                    
-                    # Method 3: Try to access global reference if available
-                    if not game_text_reader:
-                        import sys
-                        for module_name in sys.modules:
-                            module = sys.modules[module_name]
-                            if hasattr(module, 'game_text_reader_instance'):
-                                game_text_reader = module.game_text_reader_instance
-                                break
-                                
-                except Exception as e:
-                    # Only print error once, not every time
-                    if not hasattr(self, '_error_printed'):
-                        print(f"[DEBUG] Error finding game_text_reader: {e}")
-                        self._error_printed = True
+            latest_images = self.latest_images
+            if self.show_image_var.get() and area_name in latest_images:
+                # Use original image if available, process it fresh to match preview window.
+                # Original images and processing settings come from the owning GameTextReader
+                game_text_reader = self.game_text_reader
+                original_images = game_text_reader.original_images if game_text_reader else {}
                 
-                # Only print debug info once
-                if not hasattr(self, '_debug_printed'):
+                if self.DEBUG:
                     print(f"[DEBUG] game_text_reader found: {game_text_reader is not None}")
                     if game_text_reader:
-                        print(f"[DEBUG] Area '{area_name}' in original_images: {area_name in game_text_reader.original_images}")
-                        print(f"[DEBUG] Available areas: {list(game_text_reader.original_images.keys())}")
-                    self._debug_printed = True
+                        print(f"[DEBUG] Area '{area_name}' in original_images: {area_name in original_images}")
+                        print(f"[DEBUG] Available areas: {list(original_images.keys())}")
                 
-                if game_text_reader and area_name in game_text_reader.original_images:
-                    # Use original image and process fresh (like preview window)
-                    original_image = game_text_reader.original_images[area_name]
+                # Skip all work if the same source would be rendered with the same scale and settings
+                source_image = original_images.get(area_name)
+                has_original = source_image is not None
+                if has_original:
                     settings = game_text_reader.processing_settings.get(area_name, {})
+                else:
+                    source_image = latest_images[area_name]
+                    settings = None
+                try:
+                    settings_key = tuple(sorted(settings.items())) if settings is not None else None
+                    render_key = (area_name, self.scale_var.get(), self.resample_var.get(), settings_key)
+                    hash(render_key)
+                except TypeError:
+                    settings_key = render_key = None  # Unhashable setting value - always render
+                last_source = self._last_render_source() if self._last_render_source is not None else None
+                if (render_key is not None and source_image is last_source
+                        and render_key == self._last_render_key):
+                    return
+                pending = self._pending_render
+                if (render_key is not None and pending is not None and source_image is pending[0]
+                        and render_key == pending[1]):
+                    return  # The same render is already being resized
+                
+                if has_original:
+                    # Use original image and process fresh (like preview window)
+                    original_image = source_image
+                    
+                    if self.DEBUG:
+                        print(f"[DEBUG] Processing settings for {area_name}: {settings}")
+                        print(f"[DEBUG] Color mask enabled: {settings.get('color_mask_enabled', False)}")
+                        print(f"[DEBUG] Color mask color: {settings.get('color_mask_color', '#FF0000')}")
+                        print(f"[DEBUG] Color mask tolerance: {settings.get('color_mask_tolerance', 15)}")
                     
-                    print(f"[DEBUG] Processing settings for {area_name}: {settings}")
-                    print(f"[DEBUG] Color mask enabled: {settings.get('color_mask_enabled', False)}")
-                    print(f"[DEBUG] Color mask color: {settings.get('color_mask_color', '#FF0000')}")
-                    print(f"[DEBUG] Color mask tolerance: {settings.get('color_mask_tolerance', 15)}")
+                    if area_name != self._processed_cache_area:
+                        self._processed_cache.clear()
+                        self._processed_cache_area = area_name
+                    cache_key = (id(original_image), settings_key) if settings_key is not None else None
+                    cached = self._processed_cache.get(cache_key) if cache_key is not None else None
                     
-                    try:
-                        image = preprocess_image(
-                            original_image,
-                            brightness=settings.get('brightness', 1.0),
-                            contrast=settings.get('contrast', 1.0),
-                            saturation=settings.get('saturation', 1.0),
-                            sharpness=settings.get('sharpness', 1.0),
-                            blur=settings.get('blur', 0.0),
-                            threshold=settings.get('threshold', None) if settings.get('threshold_enabled', False) else None,
-                            hue=settings.get('hue', 0.0),
-                            exposure=settings.get('exposure', 1.0),
-                            color_mask_enabled=settings.get('color_mask_enabled', False),
-                            color_mask_color=settings.get('color_mask_color', '#FF0000'),
-                            color_mask_tolerance=settings.get('color_mask_tolerance', 15),
-                            color_mask_background=settings.get('color_mask_background', 'black'),
-                            color_mask_position=settings.get('color_mask_position', 'after')
-                        )
-                        print(f"[DEBUG] Image processed successfully")
-                    except Exception as e:
-                        print(f"[ERROR] Failed to process image: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        # Fallback to stored image
-                        image = self.latest_images[area_name]
+                    if cached is not None and cached[0] is original_image:
+                        self._processed_cache.move_to_end(cache_key)
+                        image = cached[1]
+                    else:
+                        try:
+                            image = preprocess_image(
+                                original_image,
+                                brightness=settings.get('brightness', 1.0),
+                                contrast=settings.get('contrast', 1.0),
+                                saturation=settings.get('saturation', 1.0),
+                                sharpness=settings.get('sharpness', 1.0),
+                                blur=settings.get('blur', 0.0),
+                                threshold=settings.get('threshold', None) if settings.get('threshold_enabled', False) else None,
+                                hue=settings.get('hue', 0.0),
+                                exposure=settings.get('exposure', 1.0),
+                                color_mask_enabled=settings.get('color_mask_enabled', False),
+                                color_mask_color=settings.get('color_mask_color', '#FF0000'),
+                                color_mask_tolerance=settings.get('color_mask_tolerance', 15),
+                                color_mask_background=settings.get('color_mask_background', 'black'),
+                                color_mask_position=settings.get('color_mask_position', 'after')
+                            )
+                            if self.DEBUG:
+                                print(f"[DEBUG] Image processed successfully")
+                            if cache_key is not None:
+                                self._processed_cache[cache_key] = (original_image, image)
+                                if len(self._processed_cache) > _PROCESSED_CACHE_SIZE:
+                                    self._processed_cache.popitem(last=False)
+                        except Exception as e:
+                            # Use sys.stderr to avoid recursion with console
+                            sys.stderr.write(f"[ERROR] Failed to process image: {e}\n")
+                            traceback.print_exc()
+                            # Fallback to stored image
+                            image = latest_images[area_name]
                 else:
                     # Fallback to stored image
-                    if not hasattr(self, '_fallback_printed'):
+                    if self.DEBUG:
                         print(f"[DEBUG] Using fallback stored image")
-                        self._fallback_printed = True
-                    image = self.latest_images[area_name]
+                    image = source_image
                 
                 try:
                     # Scale the image according to the selected percentage
                     scale_factor = int(self.scale_var.get()) / 100
-                    new_width = int(image.width * scale_factor)
-                    new_height = int(image.height * scale_factor)
-                    scaled_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-                    # Convert to PhotoImage and display
-                    photo_image = ImageTk.PhotoImage(scaled_image)
-                    self.image_label.config(image=photo_image)
-                    self.image_label.image = photo_image  # Keep a reference
-
-                    # Update window size to fit image
-                    self.window.geometry(f"{max(new_width + 50, 690)}x{max(new_height + 150, 500)}")
-                    
-                    # Create new photo before deleting old one to prevent AttributeError
-                    new_photo = ImageTk.PhotoImage(image)
-                    
-                    # Clean up previous photo if it exists (after creating new one)
-                    if hasattr(self, 'photo') and self.photo is not None:
-                        del self.photo
-                    
-                    self.photo = new_photo
-                    if self.image_label.winfo_exists():
-                        self.image_label.config(image=self.photo)
-                except Exception as e:
-                    # Silently handle "Operation on closed image" and other common image errors
-                    # since the program works fine anyway
-                    error_msg = str(e).lower()
-                    if "closed image" in error_msg or "cannot identify image file" in error_msg or "image has wrong mode" in error_msg:
-                        # Silently ignore these common image errors
-                        pass
+                    new_size = (int(image.width * scale_factor), int(image.height * scale_factor))
+                    self._render_seq += 1
+                    if new_size == image.size:
+                        # 100% - nothing to resample
+                        self._pending_render = None
+                        self._show_scaled_image(image, image, source_image, render_key)
                     else:
-                        # Only show other unexpected errors
-                        if not hasattr(self, 'photo'):
-                            self.photo = None
-                        # Use sys.stderr.write to avoid recursion with console
-                        import sys
-                        sys.stderr.write(f"Error updating image display: {e}\n")
+                        # reducing_gap lets Pillow box-reduce by an integer factor first, so the
+                        # chosen filter only runs on an image at most ~2x the target size
+                        resample = RESAMPLE_FILTERS.get(self.resample_var.get(), Image.Resampling.LANCZOS)
+                        future = self._resize_pool.submit(image.resize, new_size, resample, reducing_gap=2.0)
+                        self._pending_render = (source_image, render_key)
+                        self._poll_resize(future, self._render_seq, image, source_image, render_key)
+                except Exception as e:
+                    self._report_image_error(e)
             else:
-                if self.image_label.winfo_exists():
-                    self.image_label.config(image='')
+                if self._image_shown:  # Already-empty labels need no Tk call
+                    if self.image_label.winfo_exists():
+                        self.image_label.config(image='')
+                    self._image_shown = False
                 if hasattr(self, 'photo'):
                     del self.photo
+                self._last_render_source = None
+                self._last_render_key = None
+                self._render_seq += 1  # Drop any resize still in flight
+                self._pending_render = None
                     
         finally:
             self._updating_image = False
+    
+    def _on_view_option_changed(self, *args):
+        """Scale/Quality menu callback: redraw once the selection settles"""
+        if self._view_option_after_id is not None:
+            self.window.after_cancel(self._view_option_after_id)
+        self._view_option_after_id = self.window.after(_VIEW_OPTION_DEBOUNCE_MS, self._apply_view_options)
+    
+    def _apply_view_options(self):
+        self._view_option_after_id = None
+        self.update_image_display()
+    
+    def _poll_resize(self, future, seq, image, source_image, render_key):
+        """Tk callback: show a background resize once it is done, unless a newer one superseded it"""
+        if seq != self._render_seq or not self.window.winfo_exists():
+            # Stale - free the result whenever the worker finishes it
+            future.add_done_callback(lambda f: f.exception() is None and f.result().close())
+            return
+        if not future.done():
+            self.window.after(_RESIZE_POLL_MS, self._poll_resize, future, seq, image, source_image, render_key)
+            return
+        self._pending_render = None
+        try:
+            self._show_scaled_image(future.result(), image, source_image, render_key)
+        except Exception as e:
+            self._report_image_error(e)
+    
+    def _show_scaled_image(self, scaled_image, image, source_image, render_key):
+        """Put a scaled preview image in the label and fit the window to it"""
+        new_width, new_height = scaled_image.size
+        photo_image = getattr(self, 'photo', None)
+        if photo_image is not None and (photo_image.width(), photo_image.height()) == (new_width, new_height):
+            # Same size as what is shown - copy the pixels into the existing Tk image
+            # instead of allocating a new one and reconfiguring the label
+            photo_image.paste(scaled_image)
+        else:
+            # Convert to PhotoImage and display
+            photo_image = ImageTk.PhotoImage(scaled_image)
+            self.image_label.config(image=photo_image)
+            self.image_label.image = photo_image  # Keep a reference
+            self.photo = photo_image
+            self._image_shown = True
+        if scaled_image is not image:
+            # The PhotoImage has its own copy of the pixels - free the resized one now.
+            # image itself is cached or shared with latest_images, so it stays open
+            scaled_image.close()
+        del scaled_image
 
-    def update_console(self):
+        # Update window size to fit image - only when the fitted size changes, so new
+        # frames of the same size don't reconfigure (or undo a manual resize of) the window
+        geometry = f"{max(new_width + 50, 690)}x{max(new_height + 150, 500)}"
+        if geometry != self._last_geometry:
+            self.window.geometry(geometry)
+            self._last_geometry = geometry
+        
+        # Remember what is shown so unchanged refreshes can be skipped
+        self._last_render_source = weakref.ref(source_image)
+        self._last_render_key = render_key
+    
+    def _report_image_error(self, e):
+        # Silently handle "Operation on closed image" and other common image errors
+        # since the program works fine anyway
+        error_msg = str(e).lower()
+        if "closed image" in error_msg or "cannot identify image file" in error_msg or "image has wrong mode" in error_msg:
+            # Silently ignore these common image errors
+            pass
+        else:
+            # Only show other unexpected errors
+            if not hasattr(self, 'photo'):
+                self.photo = None
+            # Use sys.stderr.write to avoid recursion with console
+            sys.stderr.write(f"Error updating image display: {e}\n")
+
+    def update_console(self, new_text=None):
+        """
+        Show the log in the text widget.
+        
+        With new_text, only that text is appended (and old lines trimmed); without it,
+        the widget is rebuilt from the whole log buffer.
+        """
         if not hasattr(self, 'text_widget') or not self.text_widget.winfo_exists():
             return
             
         self.text_widget.config(state=tk.NORMAL)
         
-        # Get all text and split into lines
-        text = self.log_buffer.getvalue()
-        lines = text.splitlines()
-        
-        # Keep only the last MAX_LINES
-        if len(lines) > self.MAX_LINES:
-            # Join the last MAX_LINES with newlines
-            text = '\n'.join(lines[-self.MAX_LINES:]) + '\n'
-            # Update the buffer with truncated text
-            self.log_buffer.truncate(0)
-            self.log_buffer.seek(0)
-            self.log_buffer.write(text)
-        
-        # Update the text widget with formatting support
-        self.text_widget.delete(1.0, tk.END)
+        if new_text is None:
+            # Full rebuild - the buffer already holds only the last MAX_LINES lines
+            self.text_widget.delete(1.0, tk.END)
+            self._forget_urls()
+            self._insert_formatted(self.log_buffer.getvalue())
+        else:
+            self._insert_formatted(new_text)
+            
+            # Keep only the last MAX_LINES in the widget
+            line_count = int(self.text_widget.index('end-1c').split('.')[0])
+            if line_count > self.MAX_LINES:
+                self.text_widget.delete('1.0', f'{line_count - self.MAX_LINES + 1}.0')
+                self._prune_urls()
+        self._last_written = self.log_buffer.total_written
         
-        # Pattern to match URLs - http://, https://, and www.
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+|www\.[^\s<>"{}|\\^`\[\]]+'
+        self.text_widget.config(state=tk.DISABLED)
+        self.text_widget.see(tk.END)
+    
+    def _append_incremental(self):
+        """Append only the text written to log_buffer since the last update"""
+        new_count = self.log_buffer.total_written - self._last_written
+        if new_count <= 0:
+            return
+        # Only join the lines that hold new text, not the whole buffer. None means some
+        # unseen text has already rolled out of the buffer - rebuild from scratch
+        self.update_console(self.log_buffer.tail(new_count))
+    
+    def _insert_formatted(self, text):
+        """Insert text at the end of text_widget, applying [BOLD]...[/BOLD] markers and URL links"""
+        # Most log text has neither markers nor links - plain substring checks are much
+        # cheaper than parsing it
+        if '[BOLD]' not in text and 'http' not in text and 'www.' not in text:
+            self.text_widget.insert('end', text)
+            return
         
-        # Parse text for [BOLD]...[/BOLD] markers and apply formatting, also process URLs
-        bold_pattern = r'\[BOLD\](.*?)\[/BOLD\]'
+        # One scan finds both bold spans and URLs. Text and tags are gathered as
+        # (chars, tags) pairs and inserted with a single insert call - Tk tags each piece
+        # as it is inserted, no index/tag_add round trips
+        segments = []
         last_end = 0
         
-        for match in re.finditer(bold_pattern, text):
-            # Process text before the bold marker for URLs
+        for match in _TOKEN_RE.finditer(text):
+            # Plain text before the token
             if match.start() > last_end:
-                self._insert_text_with_urls(self.text_widget, text[last_end:match.start()], url_pattern)
+                segments.extend((text[last_end:match.start()], ()))
             
-            # Process bold text for URLs and apply bold formatting
-            bold_text = match.group(1)
-            start_pos = self.text_widget.index('end-1c') if self.text_widget.get('1.0', 'end-1c').strip() else '1.0'
-            self._insert_text_with_urls(self.text_widget, bold_text, url_pattern)
-            end_pos = self.text_widget.index('end-1c')
-            
-            # Apply bold tag to the inserted text
-            if start_pos != end_pos:
-                self.text_widget.tag_add('bold', start_pos, end_pos)
+            if match.lastgroup == 'url':
+                segments.extend(self._url_segment(match.group('url'), ()))
+            else:
+                # Bold text can itself contain URLs
+                self._url_segments(match.group('bold_text'), ('bold',), segments)
             
             last_end = match.end()
         
-        # Process remaining text for URLs
+        # Remaining plain text
         if last_end < len(text):
-            self._insert_text_with_urls(self.text_widget, text[last_end:], url_pattern)
+            segments.extend((text[last_end:], ()))
         
-        self.text_widget.config(state=tk.DISABLED)
-        self.text_widget.see(tk.END)
+        if segments:
+            self.text_widget.insert('end', *segments)
 
     def write(self, message):
-        """Write to the console buffer and update UI if window exists"""
-        # Always write to the buffer, even if window is closed
-        # Check buffer size and truncate if too large to prevent memory issues
+        """Queue a message for the console - safe to call from any thread"""
+        # No Tk calls here; _drain_log_queue moves it into the buffer on the Tk thread
+        self._log_queue.put(message)
+    
+    def _drain_log_queue(self):
+        """Periodic Tk callback: move all queued writes into the buffer and refresh the UI once"""
+        messages = []
         try:
-            buffer_size = len(self.log_buffer.getvalue().encode('utf-8'))
-            if buffer_size > MAX_LOG_BUFFER_SIZE:
-                # Keep only last MAX_LINES to prevent memory issues
-                text = self.log_buffer.getvalue()
-                lines = text.splitlines()
-                if len(lines) > self.MAX_LINES:
-                    text = '\n'.join(lines[-self.MAX_LINES:]) + '\n'
-                    self.log_buffer.truncate(0)
-                    self.log_buffer.seek(0)
-                    self.log_buffer.write(text)
-        except Exception:
-            pass  # If buffer check fails, continue anyway
-            
-        self.log_buffer.write(message)  # Write to the buffer
+            while True:
+                messages.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
         
-        # Only update UI if window exists
-        if hasattr(self, 'window') and self.window.winfo_exists():
-            self.update_console()  # Update the console window with line limit
-            if self.show_image_var.get():  # Update image if checkbox is checked
-                self.update_image_display()
+        try:
+            if messages:
+                # Always write to the buffer, even if window is closed
+                # (the buffer is bounded to MAX_LINES lines, so no size check is needed)
+                self.log_buffer.write(''.join(messages))
+                
+                # Only update UI if window is shown
+                if self._visible:
+                    self._append_incremental()  # Only insert the new messages
+                    if self.show_image_var.get() and not self._image_update_pending:  # Update image if checkbox is checked
+                        self._image_update_pending = True
+                        self.window.after_idle(self._flush_image_update)
+        finally:
+            # Reschedule even if this batch failed - otherwise writes would pile up in the queue forever
+            if self.window.winfo_exists():
+                self.window.after(_LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
+    
+    def _flush_image_update(self):
+        """Idle callback: refresh the image once for a burst of writes, at most every 100 ms"""
+        wait = _IMAGE_UPDATE_INTERVAL - (time.monotonic() - self._last_image_update)
+        if wait > 0:
+            # Too soon - keep the update pending and run it once the interval has passed
+            self.window.after(int(wait * 1000) + 1, self._flush_image_update)
+            return
+        self._image_update_pending = False
+        self._last_image_update = time.monotonic()
+        if self.show_image_var.get():
+            self.update_image_display()
+
+    def _log_line(self, message):
+        """Log a message from the console's own (Tk thread) actions straight into the buffer"""
+        # Skips print()'s round trip through sys.stdout, the queue and the next drain
+        self.log_buffer.write(message + '\n')
+        if self._visible:
+            self._append_incremental()
 
     def flush(self):
         pass
@@ -408,9 +669,9 @@ class ConsoleWindow:
         suggested_name = f"Log_{save_file_name}_{current_time}.txt"
         file_path = filedialog.asksaveasfilename(defaultextension=".txt", initialfile=suggested_name, filetypes=[("Text files", "*.txt")])
         if file_path:
-            with open(file_path, 'w') as f:
-                f.write(self.log_buffer.getvalue())
-            print(f"Log saved to {file_path}\n--------------------------")
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.writelines(self.log_buffer)  # Line by line, without joining the whole log first
+            self._log_line(f"Log saved to {file_path}\n--------------------------")
      
             
     def save_image(self):
@@ -433,7 +694,7 @@ class ConsoleWindow:
         )
         if file_path:
             latest_image.save(file_path, "PNG")
-            print(f"Image saved to {file_path}\n--------------------------")
+            self._log_line(f"Image saved to {file_path}\n--------------------------")
 
     def clear_console(self):
         """Clear the console text widget and log buffer"""
@@ -443,36 +704,62 @@ class ConsoleWindow:
         # Clear the text widget
         self.text_widget.config(state=tk.NORMAL)
         self.text_widget.delete(1.0, tk.END)
+        self._forget_urls()
         self.text_widget.config(state=tk.DISABLED)
         
         # Clear the log buffer
-        self.log_buffer.seek(0)
-        self.log_buffer.truncate(0)
+        self.log_buffer.clear()
+        self._last_written = self.log_buffer.total_written
+        
+        # Drop cached preview images
+        self._processed_cache.clear()
         
         # Add a confirmation message
-        print("Console cleared.\n--------------------------")
+        self._log_line("Console cleared.\n--------------------------")
     
-    def _insert_text_with_urls(self, text_widget, text, url_pattern):
-        """Insert text and make URLs clickable"""
+    def _url_segments(self, text, tags, segments):
+        """Append (chars, tags) insert arguments for text to segments, tagging URLs with 'url'"""
+        if 'http' not in text and 'www.' not in text:
+            # No URL can match - skip the regex scan
+            if text:
+                segments.extend((text, tags))
+            return segments
+        
         last_end = 0
-        for match in re.finditer(url_pattern, text):
-            # Insert text before the URL
+        for match in _URL_RE.finditer(text):
+            # Text before the URL
             if match.start() > last_end:
-                text_widget.insert('end', text[last_end:match.start()])
-            
-            # Insert the URL as a clickable link
-            url = match.group(0)
-            start_pos = text_widget.index('end-1c') if text_widget.get('1.0', 'end-1c').strip() else '1.0'
-            text_widget.insert('end', url)
-            end_pos = text_widget.index('end-1c')
+                segments.extend((text[last_end:match.start()], tags))
             
-            # Apply URL tag
-            if start_pos != end_pos:
-                text_widget.tag_add('url', start_pos, end_pos)
+            # The URL as a clickable link
+            segments.extend(self._url_segment(match.group(0), tags))
             
             last_end = match.end()
         
-        # Insert remaining text
+        # Remaining text
         if last_end < len(text):
-            text_widget.insert('end', text[last_end:])
-
+            segments.extend((text[last_end:], tags))
+        return segments
+    
+    def _url_segment(self, url, tags):
+        """(chars, tags) insert arguments for a link, with its own tag to look it up on click"""
+        url_tag = f'url_{self._url_seq}'
+        self._url_seq += 1
+        self._urls[url_tag] = url
+        return url, tags + ('url', url_tag)
+    
+    def _prune_urls(self):
+        """Drop url_N tags whose links were trimmed off the top of the log"""
+        # Links are stored in text order, so the trimmed ones are always the oldest
+        while self._urls:
+            url_tag = next(iter(self._urls))
+            if self.text_widget.tag_ranges(url_tag):
+                break
+            del self._urls[url_tag]
+            self.text_widget.tag_delete(url_tag)
+    
+    def _forget_urls(self):
+        """Drop all url_N tags after the text widget was cleared"""
+        if self._urls:
+            self.text_widget.tag_delete(*self._urls)
+            self._urls.clear()
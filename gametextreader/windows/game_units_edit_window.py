@@ -1,14 +1,102 @@
 """
 Game units editor window for managing game unit mappings
 """
+import functools
 import json
 import os
+import types
 import tkinter as tk
 from tkinter import messagebox, ttk
 import win32com.client
 
 from ..constants import APP_DOCUMENTS_DIR
 
+# Default game units, in the order the editor lists them. Built once at import; the
+# mapping is read-only because every editor window shares it
+DEFAULT_GAME_UNITS = types.MappingProxyType({
+    'xp': 'Experience Points',
+    'hp': 'Health Points',
+    'mp': 'Mana Points',
+    'gp': 'Gold Pieces',
+    'pp': 'Platinum Pieces',
+    'sp': 'Skill Points',
+    'ep': 'Energy Points',
+    'ap': 'Action Points',
+    'bp': 'Battle Points',
+    'lp': 'Loyalty Points',
+    'cp': 'Challenge Points',
+    'vp': 'Victory Points',
+    'rp': 'Reputation Points',
+    'tp': 'Talent Points',
+    'ar': 'Armor Rating',
+    'dmg': 'Damage',
+    'dps': 'Damage Per Second',
+    'def': 'Defense',
+    'mat': 'Materials',
+    'exp': 'Exploration Points',
+    '§': 'Simoliance',
+    'v-bucks': 'Virtual Bucks',
+    'r$': 'Robux',
+    'nmt': 'Nook Miles Tickets',
+    'be': 'Blue Essence',
+    'radianite': 'Radianite Points',
+    'ow coins': 'Overwatch Coins',
+    '₽': 'PokeDollars',
+    '€$': 'Eurodollars',
+    'z': 'Zenny',
+    'l': 'Lunas',
+    'e': 'Eve',
+    'i': 'Isk',
+    'j': 'Jewel',
+    'sc': 'Star Coins',
+    'o2': 'Oxygen',
+    'pu': 'Power Units',
+    'mc': 'Mana Crystals',
+    'es': 'Essence',
+    'sh': 'Shards',
+    'st': 'Stars',
+    'mu': 'Munny',
+    'b': 'Bolts',
+    'r': 'Rings',
+    'ca': 'Caps',
+    'rns': 'Runes',
+    'sl': 'Souls',
+    'fav': 'Favor',
+    'am': 'Amber',
+    'cc': 'Crystal Cores',
+    'fg': 'Fragments'
+})
+DEFAULT_GAME_UNITS_LIST = tuple(DEFAULT_GAME_UNITS.items())
+
+# Rows built right away when the editor opens (about one screenful); the rest are built
+# ROW_BUILD_BATCH at a time from the event loop so the window shows and responds immediately
+INITIAL_ROWS = 15
+ROW_BUILD_BATCH = 10
+
+
+@functools.lru_cache(maxsize=64)
+def _format_voice_display(full_name):
+    """Abbreviate a SAPI voice description for the voice menu, e.g. "David (English - United States)"."""
+    if " - " in full_name:
+        parts = full_name.split(" - ")
+        if len(parts) == 2:
+            voice_part, lang_part = parts
+            if "Microsoft" in full_name:
+                voice_part = voice_part.replace("Microsoft ", "")
+            return f"{voice_part} ({lang_part})"
+    return full_name
+
+
+class EntryRow:
+    """The entries, checkbox variable and frame of one editor row (the buttons live on as children of row_frame)."""
+    __slots__ = ('short_entry', 'full_entry', 'case_sensitive_var', 'row_frame')
+    
+    def __init__(self, short_entry, full_entry, case_sensitive_var, row_frame):
+        self.short_entry = short_entry
+        self.full_entry = full_entry
+        self.case_sensitive_var = case_sensitive_var
+        self.row_frame = row_frame
+
 
 class GameUnitsEditWindow:
     def __init__(self, root, game_text_reader):
@@ -30,8 +118,7 @@ class GameUnitsEditWindow:
         except Exception as e:
             print(f"Error setting game units editor icon: {e}")
         
-        # Center the window
-        self.window.update_idletasks()
+        # Center the window (the size is fixed above, so no layout pass is needed first)
         x = (self.window.winfo_screenwidth() // 2) - (500 // 2)
         y = (self.window.winfo_screenheight() // 2) - (600 // 2)
         self.window.geometry(f"500x600+{x}+{y}")
@@ -39,17 +126,38 @@ class GameUnitsEditWindow:
         # Load game units data
         self.game_units = self.game_text_reader.load_game_units()
         self.original_units = self.game_units.copy()
+        # False if the file is missing or corrupt (and wasn't recreated) - Save must then always write it
+        self._units_file_ok = self.game_text_reader._game_units_file_ok
         
-        # Get default units as a list to preserve order
-        default_units_dict = self.get_default_units()
-        self.default_units_list = [(short, full) for short, full in default_units_dict.items()]
+        # Default units as (short, full) pairs, in order
+        self.default_units_list = DEFAULT_GAME_UNITS_LIST
         
         # Store entry widgets and variables
-        self.entry_widgets = []  # List of (short_name_var, full_name_var, case_sensitive_var, short_entry, full_entry, case_frame, case_checkbox, listen_btn, delete_btn, default_btn, row_frame)
+        self.entry_widgets = []  # List of EntryRow, in display order
+        self._row_index = {}  # EntryRow -> position in entry_widgets
+        
+        # Rows still waiting to be built by _build_pending_rows: (short_name, full_name, case_sensitive)
+        self._pending_rows = []
+        self._pending_rows_after = None
         
         # Voice selection variables
         self.selected_voice = None
         self.current_speaker = None
+        self._speaker_voice = None  # Voice object currently set on current_speaker
+        
+        # Mousewheel units waiting for the next idle scroll
+        self._wheel_accum = 0
+        self._wheel_pending = False
+        self._wheel_bound = False  # Whether our bind_all("<MouseWheel>") is active
+        
+        # Set while a scroll region update is scheduled
+        self._scroll_dirty = False
+        
+        # Set by the first edit; until then Cancel can close without comparing every row
+        self._dirty = False
+        # Entry validatecommand that marks the window dirty - it runs for every text change
+        # (typing, paste, cut, drag-and-drop, X11 middle-click), not only for key presses
+        self._dirty_vcmd = self.window.register(self._on_entry_edit)
         
         # Set up protocol to handle window closing
         self.window.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -79,27 +187,10 @@ class GameUnitsEditWindow:
         
         if hasattr(self.game_text_reader, 'voices') and self.game_text_reader.voices:
             try:
-                for i, voice in enumerate(self.game_text_reader.voices, 1):
-                    full_name = voice.GetDescription()
-                    
-                    # Create abbreviated display name with numbering
-                    if "Microsoft" in full_name and " - " in full_name:
-                        parts = full_name.split(" - ")
-                        if len(parts) == 2:
-                            voice_part = parts[0].replace("Microsoft ", "")
-                            lang_part = parts[1]
-                            display_name = f"{i}. {voice_part} ({lang_part})"
-                        else:
-                            display_name = f"{i}. {full_name}"
-                    elif " - " in full_name:
-                        parts = full_name.split(" - ")
-                        if len(parts) == 2:
-                            display_name = f"{i}. {parts[0]} ({parts[1]})"
-                        else:
-                            display_name = f"{i}. {full_name}"
-                    else:
-                        display_name = f"{i}. {full_name}"
-                    
+                # Descriptions are cached on the reader - no COM call per voice here
+                for i, full_name in enumerate(self.game_text_reader._voice_descriptions, 1):
+                    # Abbreviated display name with numbering
+                    display_name = f"{i}. {_format_voice_display(full_name)}"
                     voice_display_names.append(display_name)
                     voice_full_names[display_name] = full_name
             except Exception as e:
@@ -130,11 +221,11 @@ class GameUnitsEditWindow:
         voice_menu.pack(side='left', padx=5)
         
         # Stop button
-        stop_button = tk.Button(top_frame, text="Stop", command=self.stop_speech, width=8)
+        stop_button = ttk.Button(top_frame, text="Stop", command=self.stop_speech, width=8)
         stop_button.pack(side='left', padx=10)
         
-        # Separator
-        ttk.Separator(self.window, orient='horizontal').pack(fill='x', padx=10, pady=5)
+        # Separator - a plain 1px frame; ttk.Separator tiles an image across the width on every resize
+        tk.Frame(self.window, height=1, bg='#808080').pack(fill='x', padx=10, pady=5)
         
         # Scrollable frame for entries
         canvas_frame = tk.Frame(self.window)
@@ -145,10 +236,9 @@ class GameUnitsEditWindow:
         scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=canvas.yview)
         self.scrollable_frame = tk.Frame(canvas)
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Configure events only mark the scroll region stale; it is recomputed once per idle
+        # cycle, not for every row added or every step of a window resize
+        self.scrollable_frame.bind("<Configure>", self._mark_scroll_dirty)
         
         # Create window that fills the canvas width
         canvas_window = canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
@@ -157,7 +247,7 @@ class GameUnitsEditWindow:
         def configure_scroll_region(event):
             canvas_width = event.width
             canvas.itemconfig(canvas_window, width=canvas_width)
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            self._mark_scroll_dirty()
         
         canvas.bind('<Configure>', configure_scroll_region)
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -166,25 +256,57 @@ class GameUnitsEditWindow:
         scrollbar.pack(side="right", fill="y")
         
         # Bind mousewheel to canvas and canvas_frame for better coverage
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        # Wheel notches are summed and scrolled once per idle cycle, so a fast spin
+        # moves the canvas in one step instead of one redraw per notch
+        def _scroll_by(units):
+            self._wheel_accum += units
+            if not self._wheel_pending:
+                self._wheel_pending = True
+                self.window.after_idle(_flush_wheel)
+        
+        def _flush_wheel():
+            self._wheel_pending = False
+            units, self._wheel_accum = self._wheel_accum, 0
+            if units and canvas.winfo_exists():
+                canvas.yview_scroll(units, "units")
         
-        # Bind to canvas and canvas_frame, and also use bind_all for global capture
-        canvas.bind("<MouseWheel>", _on_mousewheel)
-        canvas_frame.bind("<MouseWheel>", _on_mousewheel)
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        def _on_mousewheel(event):
+            _scroll_by(int(-1*(event.delta/120)))
         
         # Also bind Linux mousewheel events
-        def _on_mousewheel_linux(event):
-            canvas.yview_scroll(int(-1*(event.delta)), "units")
-        canvas.bind("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
-        canvas.bind("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
+        canvas.bind("<Button-4>", lambda e: _scroll_by(-1))
+        canvas.bind("<Button-5>", lambda e: _scroll_by(1))
         
-        # Set focus to canvas when mouse enters
+        # The wheel is captured with bind_all only while the mouse is over the list (the rows
+        # are child widgets, so a plain canvas binding would miss them); other windows keep
+        # their own wheel handling the rest of the time
         def _on_enter(event):
             canvas.focus_set()
+            if not self._wheel_bound:
+                canvas.bind_all("<MouseWheel>", _on_mousewheel)
+                self._wheel_bound = True
+        
+        def _on_leave(event):
+            # Moving onto a row also sends Leave - only release once the pointer is outside the list
+            try:
+                widget = canvas.winfo_containing(*canvas.winfo_pointerxy())
+            except (KeyError, tk.TclError):
+                widget = None  # Pointer is over a widget tkinter doesn't know (e.g. a menu)
+            if widget is not None and (str(widget) + '.').startswith(str(canvas_frame) + '.'):
+                return
+            _release_mousewheel()
+        
+        def _release_mousewheel(event=None):
+            if self._wheel_bound:
+                canvas.unbind_all("<MouseWheel>")
+                self._wheel_bound = False
+        
         canvas.bind("<Enter>", _on_enter)
         canvas_frame.bind("<Enter>", _on_enter)
+        canvas.bind("<Leave>", _on_leave)
+        canvas_frame.bind("<Leave>", _on_leave)
+        # Don't leave the global binding behind if the window closes under the pointer
+        canvas.bind("<Destroy>", _release_mousewheel)
         
         # Headers
         header_frame = tk.Frame(self.scrollable_frame)
@@ -198,7 +320,7 @@ class GameUnitsEditWindow:
         self.scrollable_frame = self.scrollable_frame
         
         # Separator
-        ttk.Separator(self.window, orient='horizontal').pack(fill='x', padx=10, pady=5)
+        tk.Frame(self.window, height=1, bg='#808080').pack(fill='x', padx=10, pady=5)
         
         # Bottom frame with Add New, Delete All, Reset to Default, Save, and Cancel buttons
         bottom_frame = tk.Frame(self.window)
@@ -209,15 +331,15 @@ class GameUnitsEditWindow:
         left_frame.pack(side='left', padx=5)
         
         # Add New button
-        add_button = tk.Button(left_frame, text="Add New", command=self.add_new_entry, width=10)
+        add_button = ttk.Button(left_frame, text="Add New", command=self.add_new_entry, width=10)
         add_button.pack(side='left', padx=2)
         
         # Delete All button
-        delete_all_button = tk.Button(left_frame, text="Delete All", command=self.delete_all_entries, width=10)
+        delete_all_button = ttk.Button(left_frame, text="Delete All", command=self.delete_all_entries, width=10)
         delete_all_button.pack(side='left', padx=2)
         
         # Reset to Default button
-        reset_default_button = tk.Button(left_frame, text="Reset to Default", command=self.reset_to_default, width=12)
+        reset_default_button = ttk.Button(left_frame, text="Reset to Default", command=self.reset_to_default, width=-12)  # ttk: negative width is a minimum, so the label isn't clipped
         reset_default_button.pack(side='left', padx=2)
         
         # Spacer
@@ -228,13 +350,34 @@ class GameUnitsEditWindow:
         right_frame.pack(side='right', padx=5)
         
         # Save button
-        save_button = tk.Button(right_frame, text="Save", command=self.save_units, width=10)
+        save_button = ttk.Button(right_frame, text="Save", command=self.save_units, width=10)
         save_button.pack(side='right', padx=2)
         
         # Cancel button
-        cancel_button = tk.Button(right_frame, text="Cancel", command=self.cancel_edit, width=10)
+        cancel_button = ttk.Button(right_frame, text="Cancel", command=self.cancel_edit, width=10)
         cancel_button.pack(side='right', padx=2)
     
+    def _mark_scroll_dirty(self, event=None):
+        """Schedule a scroll region update for the next idle cycle."""
+        if not self._scroll_dirty:
+            self._scroll_dirty = True
+            self.window.after_idle(self._flush_scrollregion)
+    
+    def _flush_scrollregion(self):
+        """Fit the canvas scroll region to its contents."""
+        self._scroll_dirty = False
+        if self.canvas.winfo_exists():
+            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    
+    def _scroll_to(self, fraction):
+        """Move the view to fraction once Tk has laid out the rows, instead of forcing a layout now."""
+        def scroll():
+            # The new rows' Configure events may not have been handled yet - refit first
+            self._flush_scrollregion()
+            if self.canvas.winfo_exists():
+                self.canvas.yview_moveto(fraction)
+        self.window.after_idle(scroll)
+    
     def load_case_sensitive_settings(self):
         """Load case-sensitive settings from JSON file."""
         try:
@@ -261,7 +404,8 @@ class GameUnitsEditWindow:
             file_path = os.path.join(temp_path, 'gamer_units_case_sensitive.json')
             
             with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(case_sensitive_dict, f, indent=4, ensure_ascii=False)
+                # Compact - this file is only read back by the app
+                json.dump(case_sensitive_dict, f, ensure_ascii=False, separators=(',', ':'))
                 
         except Exception as e:
             print(f"Error saving case-sensitive settings: {e}")
@@ -270,10 +414,39 @@ class GameUnitsEditWindow:
         """Populate the scrollable frame with existing game units."""
         # Load case-sensitive settings if they exist
         case_sensitive_settings = self.load_case_sensitive_settings()
-        
-        for short_name, full_name in self.game_units.items():
-            case_sensitive = case_sensitive_settings.get(short_name, False)
-            self.add_entry_row(short_name, full_name, case_sensitive)
+        # Kept for the unsaved-changes check, so cancelling doesn't read the file again
+        self._original_case_sensitive = case_sensitive_settings
+        
+        self._pending_rows = [
+            (short_name, full_name, case_sensitive_settings.get(short_name, False))
+            for short_name, full_name in self.game_units.items()
+        ]
+        self._build_pending_rows(INITIAL_ROWS)
+    
+    def _build_pending_rows(self, count=ROW_BUILD_BATCH):
+        """Build the next count pending rows and schedule the next batch."""
+        self._pending_rows_after = None
+        batch = self._pending_rows[:count]
+        del self._pending_rows[:count]
+        for row in batch:
+            self.add_entry_row(*row)
+        if self._pending_rows:
+            # after() rather than after_idle() so user input is handled between batches
+            self._pending_rows_after = self.window.after(1, self._build_pending_rows)
+    
+    def _finish_pending_rows(self):
+        """Build all remaining rows now - needed before anything reads or appends to the row list."""
+        self._cancel_pending_rows(discard=False)
+        if self._pending_rows:
+            self._build_pending_rows(len(self._pending_rows))
+    
+    def _cancel_pending_rows(self, discard=True):
+        """Stop building rows in the background (and forget the unbuilt ones if discard)."""
+        if self._pending_rows_after is not None:
+            self.window.after_cancel(self._pending_rows_after)
+            self._pending_rows_after = None
+        if discard:
+            self._pending_rows.clear()
     
     def add_entry_row(self, short_name="", full_name="", case_sensitive=False):
         """Add a new row for editing a game unit entry."""
@@ -285,54 +458,64 @@ class GameUnitsEditWindow:
         has_default = current_row_index < len(self.default_units_list)
         
         # Short name entry
-        short_name_var = tk.StringVar(value=short_name)
-        short_entry = tk.Entry(row_frame, textvariable=short_name_var, width=18)
+        # (no StringVar - the text is read straight from the Entry, one Tcl call instead of two)
+        short_entry = tk.Entry(row_frame, width=18)
+        short_entry.insert(0, short_name)
+        short_entry.config(validate='key', validatecommand=self._dirty_vcmd)
         short_entry.pack(side='left', padx=5)
         
         # Full name entry
-        full_name_var = tk.StringVar(value=full_name)
-        full_entry = tk.Entry(row_frame, textvariable=full_name_var, width=20)
+        full_entry = tk.Entry(row_frame, width=20)
+        full_entry.insert(0, full_name)
+        full_entry.config(validate='key', validatecommand=self._dirty_vcmd)
         full_entry.pack(side='left', padx=5)
         
         # Case sensitive checkbox
+        # (the checkbox and action buttons are packed straight into row_frame - no wrapper
+        # frames, so every row costs two fewer widgets to create and lay out)
         case_sensitive_var = tk.BooleanVar(value=case_sensitive)
-        case_frame = tk.Frame(row_frame)
-        case_frame.pack(side='left', padx=0)
-        case_checkbox = tk.Checkbutton(case_frame, variable=case_sensitive_var, text="Case\nSensitive")
-        case_checkbox.pack(side='left')
+        case_checkbox = tk.Checkbutton(row_frame, variable=case_sensitive_var, text="Case\nSensitive", command=self._mark_dirty)
+        case_checkbox.pack(side='left', padx=0)
         
-        # Actions frame
-        actions_frame = tk.Frame(row_frame)
-        actions_frame.pack(side='left', padx=10)
+        row = EntryRow(short_entry, full_entry, case_sensitive_var, row_frame)
         
         # Listen button - use lambda with default argument to capture current value
-        listen_btn = tk.Button(actions_frame, text="Listen", command=lambda var=full_name_var: self.listen_to_text(var.get()), width=7)
-        listen_btn.pack(side='left', padx=2)
+        listen_btn = tk.Button(row_frame, text="Listen", command=lambda entry=full_entry: self.listen_to_text(entry.get()), width=7)
+        listen_btn.pack(side='left', padx=(12, 2))
         
         # Delete button
-        delete_btn = tk.Button(actions_frame, text="Delete", command=lambda: self.delete_entry(row_frame, short_name_var, full_name_var, case_sensitive_var), width=7)
+        delete_btn = tk.Button(row_frame, text="Delete", command=lambda: self.delete_entry(row), width=7)
         delete_btn.pack(side='left', padx=2)
         
         # Default button - only add if this row is within the default list range
-        default_btn = None
+        # (rows without one simply end after Delete, everything is packed from the left)
         if has_default:
-            default_btn = tk.Button(actions_frame, text="Default", command=lambda: self.restore_default(short_name_var, full_name_var, case_sensitive_var, row_frame), width=7)
+            default_btn = tk.Button(row_frame, text="Default", command=lambda: self.restore_default(row), width=7)
             default_btn.pack(side='left', padx=(2, 5))
-        else:
-            # Add padding to match spacing when there's no Default button
-            tk.Frame(actions_frame, width=7).pack(side='left', padx=(2, 5))
         
-        # Store widgets
-        self.entry_widgets.append((short_name_var, full_name_var, case_sensitive_var, short_entry, full_entry, case_frame, case_checkbox, listen_btn, delete_btn, default_btn, row_frame))
+        # Store the row
+        self._row_index[row] = len(self.entry_widgets)
+        self.entry_widgets.append(row)
+    
+    def _mark_dirty(self, event=None):
+        """Note that the user has edited something."""
+        self._dirty = True
+    
+    def _on_entry_edit(self):
+        """Entry validatecommand: note the edit and always accept it."""
+        self._dirty = True
+        return True
     
     def delete_all_entries(self):
         """Delete all entries from the editor."""
         if messagebox.askyesno("Delete All", "Are you sure you want to delete all game units? This action cannot be undone."):
+            self._dirty = True
+            self._cancel_pending_rows()
             # Clear all entry widgets
-            for widget in self.entry_widgets:
-                row_frame = widget[10]  # row_frame is at index 10 now
-                row_frame.destroy()
+            for row in self.entry_widgets:
+                row.row_frame.destroy()
             self.entry_widgets.clear()
+            self._row_index.clear()
             
             # Add one empty entry row
             self.add_entry_row("", "")
@@ -340,91 +523,37 @@ class GameUnitsEditWindow:
     def reset_to_default(self):
         """Reset all entries to default values."""
         if messagebox.askyesno("Reset to Default", "This will replace all current entries with the default values. Any custom entries will be lost. Continue?"):
+            self._dirty = True
+            self._cancel_pending_rows()
             # Clear all existing entries
-            for widget in self.entry_widgets:
-                row_frame = widget[10]  # row_frame is at index 10 now
-                row_frame.destroy()
+            for row in self.entry_widgets:
+                row.row_frame.destroy()
             self.entry_widgets.clear()
+            self._row_index.clear()
             
             # Add all default entries
             for short_name, full_name in self.default_units_list:
                 self.add_entry_row(short_name, full_name)
             
             # Scroll to top
-            self.canvas.update_idletasks()
-            self.canvas.yview_moveto(0.0)
+            self._scroll_to(0.0)
     
     def add_new_entry(self):
         """Add a new empty entry row."""
+        self._dirty = True
+        self._finish_pending_rows()  # New rows go after all existing ones
         self.add_entry_row("", "")
         # Scroll to bottom
-        self.canvas.update_idletasks()
-        self.canvas.yview_moveto(1.0)
+        self._scroll_to(1.0)
     
     def get_default_units(self):
-        """Get the default game units from the source code."""
-        return {
-            'xp': 'Experience Points',
-            'hp': 'Health Points',
-            'mp': 'Mana Points',
-            'gp': 'Gold Pieces',
-            'pp': 'Platinum Pieces',
-            'sp': 'Skill Points',
-            'ep': 'Energy Points',
-            'ap': 'Action Points',
-            'bp': 'Battle Points',
-            'lp': 'Loyalty Points',
-            'cp': 'Challenge Points',
-            'vp': 'Victory Points',
-            'rp': 'Reputation Points',
-            'tp': 'Talent Points',
-            'ar': 'Armor Rating',
-            'dmg': 'Damage',
-            'dps': 'Damage Per Second',
-            'def': 'Defense',
-            'mat': 'Materials',
-            'exp': 'Exploration Points',
-            '§': 'Simoliance',
-            'v-bucks': 'Virtual Bucks',
-            'r$': 'Robux',
-            'nmt': 'Nook Miles Tickets',
-            'be': 'Blue Essence',
-            'radianite': 'Radianite Points',
-            'ow coins': 'Overwatch Coins',
-            '₽': 'PokeDollars',
-            '€$': 'Eurodollars',
-            'z': 'Zenny',
-            'l': 'Lunas',
-            'e': 'Eve',
-            'i': 'Isk',
-            'j': 'Jewel',
-            'sc': 'Star Coins',
-            'o2': 'Oxygen',
-            'pu': 'Power Units',
-            'mc': 'Mana Crystals',
-            'es': 'Essence',
-            'sh': 'Shards',
-            'st': 'Stars',
-            'mu': 'Munny',
-            'b': 'Bolts',
-            'r': 'Rings',
-            'ca': 'Caps',
-            'rns': 'Runes',
-            'sl': 'Souls',
-            'fav': 'Favor',
-            'am': 'Amber',
-            'cc': 'Crystal Cores',
-            'fg': 'Fragments'
-        }
+        """Get the default game units (read-only, shared by all editor windows)."""
+        return DEFAULT_GAME_UNITS
     
-    def restore_default(self, short_name_var, full_name_var, case_sensitive_var, row_frame):
+    def restore_default(self, row):
         """Restore the default value for a game unit entry based on its position in the list."""
         # Find the index of this row in the entry_widgets list
-        row_index = None
-        for i, (s_var, f_var, cs_var, s_entry, f_entry, cs_frame, cs_checkbox, l_btn, d_btn, def_btn, r_frame) in enumerate(self.entry_widgets):
-            if r_frame == row_frame:
-                row_index = i
-                break
+        row_index = self._row_index.get(row)
         
         if row_index is None:
             messagebox.showerror("Error", "Could not find row position.")
@@ -438,9 +567,9 @@ class GameUnitsEditWindow:
         # Get the default values for this position
         default_short_name, default_full_name = self.default_units_list[row_index]
         
-        current_short_name = short_name_var.get().strip()
-        current_full_name = full_name_var.get().strip()
-        current_case_sensitive = case_sensitive_var.get()
+        current_short_name = row.short_entry.get().strip()
+        current_full_name = row.full_entry.get().strip()
+        current_case_sensitive = row.case_sensitive_var.get()
         
         # Check if already at default
         if (current_short_name == default_short_name and 
@@ -454,35 +583,41 @@ class GameUnitsEditWindow:
                                f"Restore this row to default values (position {row_index + 1})?\n\n"
                                f"Current:\n  Short: {current_short_name or '(empty)'}\n  Full: {current_full_name or '(empty)'}\n  Case Sensitive: {current_case_sensitive}\n\n"
                                f"Default:\n  Short: {default_short_name}\n  Full: {default_full_name}\n  Case Sensitive: No"):
-            short_name_var.set(default_short_name)
-            full_name_var.set(default_full_name)
-            case_sensitive_var.set(False)
+            row.short_entry.delete(0, 'end')
+            row.short_entry.insert(0, default_short_name)
+            row.full_entry.delete(0, 'end')
+            row.full_entry.insert(0, default_full_name)
+            row.case_sensitive_var.set(False)
+            self._dirty = True
     
-    def delete_entry(self, row_frame, short_name_var, full_name_var, case_sensitive_var):
+    def delete_entry(self, row):
         """Delete an entry row."""
-        # Remove from entry_widgets list
-        for i, (s_var, f_var, cs_var, s_entry, f_entry, cs_frame, cs_checkbox, l_btn, d_btn, def_btn, r_frame) in enumerate(self.entry_widgets):
-            if r_frame == row_frame:
-                self.entry_widgets.pop(i)
-                break
+        self._dirty = True
+        # Remove from entry_widgets list and shift the positions of the rows after it
+        i = self._row_index.pop(row, None)
+        if i is not None:
+            self.entry_widgets.pop(i)
+            for k in range(i, len(self.entry_widgets)):
+                self._row_index[self.entry_widgets[k]] = k
         
         # Destroy the row frame
-        row_frame.destroy()
+        row.row_frame.destroy()
     
     def listen_to_text(self, text):
         """Read the given text aloud using the selected voice."""
         if not text:
             return
         
-        # Stop any current speech
-        self.stop_speech()
+        # Stop main window speech (this window's own speech is purged by Speak below)
+        if hasattr(self.game_text_reader, 'stop_speaking'):
+            self.game_text_reader.stop_speaking()
         
         # Get the selected voice
         voice = self.selected_voice
         if not voice and hasattr(self.game_text_reader, 'voices') and self.game_text_reader.voices:
             # Use first available voice if none selected
             try:
-                voice = self.game_text_reader.voices[0].GetDescription()
+                voice = self.game_text_reader._voice_descriptions[0]
             except (IndexError, AttributeError, Exception):
                 # Silently fail if no voices available or voice object doesn't have GetDescription
                 pass
@@ -491,26 +626,28 @@ class GameUnitsEditWindow:
             messagebox.showwarning("No Voice Selected", "Please select a voice from the dropdown.")
             return
         
-        # Create a temporary speaker for this window
+        # One speaker per window, created on the first Listen and reused afterwards
         try:
-            self.current_speaker = win32com.client.Dispatch("SAPI.SpVoice")
+            if self.current_speaker is None:
+                self.current_speaker = win32com.client.Dispatch("SAPI.SpVoice")
+                self._speaker_voice = None
             
-            # Set the voice
-            for v in self.game_text_reader.voices:
+            # Set the voice - only when it changed, assigning Voice is itself a costly COM call
+            voice_obj = self.game_text_reader._voice_by_description.get(voice)
+            if voice_obj is not None and voice_obj is not self._speaker_voice:
                 try:
-                    if v.GetDescription() == voice:
-                        self.current_speaker.Voice = v
-                        break
-                except (AttributeError, Exception):
-                    # Voice object may not have GetDescription or setting voice may fail
-                    continue
+                    self.current_speaker.Voice = voice_obj
+                    self._speaker_voice = voice_obj
+                except Exception:
+                    # Setting the voice may fail - keep the previous voice
+                    pass
             
             # Set volume
             if hasattr(self.game_text_reader, 'volume'):
                 self.current_speaker.Volume = int(self.game_text_reader.volume.get())
             
-            # Speak the text
-            self.current_speaker.Speak(text, 1)  # 1 is SVSFlagsAsync
+            # Speak the text, cutting off whatever this speaker was still saying
+            self.current_speaker.Speak(text, 1 | 2)  # SVSFlagsAsync | SVSFPurgeBeforeSpeak
         except Exception as e:
             print(f"Error speaking text: {e}")
             messagebox.showerror("Error", f"Could not read text: {e}")
@@ -520,7 +657,6 @@ class GameUnitsEditWindow:
         try:
             if self.current_speaker:
                 self.current_speaker.Speak("", 2)  # 2 is SVSFPurgeBeforeSpeak
-                self.current_speaker = None
         except Exception as e:
             print(f"Error stopping speech: {e}")
         
@@ -530,15 +666,16 @@ class GameUnitsEditWindow:
     
     def save_units(self):
         """Save the game units to the JSON file."""
+        self._finish_pending_rows()
         # Collect data from all entries
         new_units = {}
         case_sensitive_settings = {}
         errors = []
         
-        for short_name_var, full_name_var, case_sensitive_var, short_entry, full_entry, case_frame, case_checkbox, listen_btn, delete_btn, default_btn, row_frame in self.entry_widgets:
-            short_name = short_name_var.get().strip()
-            full_name = full_name_var.get().strip()
-            case_sensitive = case_sensitive_var.get()
+        for row in self.entry_widgets:
+            short_name = row.short_entry.get().strip()
+            full_name = row.full_entry.get().strip()
+            case_sensitive = row.case_sensitive_var.get()
             
             # Skip empty entries
             if not short_name and not full_name:
@@ -573,23 +710,27 @@ class GameUnitsEditWindow:
             
             file_path = os.path.join(temp_path, 'gamer_units.json')
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                if new_units:
-                    # Only write header and content if there are units to save
-                    header = '''//  Game Units Configuration
+            # Skip rewriting the file when nothing changed (order included, as it's kept in the file),
+            # but only if it was read successfully - a corrupt or missing file is always replaced
+            if list(new_units.items()) != list(self.original_units.items()) or not self._units_file_ok or not os.path.exists(file_path):
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    if new_units:
+                        # Only write header and content if there are units to save
+                        header = '''//  Game Units Configuration
 //  Format: "short_name": "Full Name"
 //  Example: "xp" will be read as "Experience Points"
 //  Enable "Read gamer units" in the main window to use this feature
 
 '''
-                    f.write(header)
-                    json.dump(new_units, f, indent=4, ensure_ascii=False)
-                else:
-                    # Write empty JSON object for completely empty file
-                    f.write('{}')
+                        f.write(header)
+                        json.dump(new_units, f, indent=4, ensure_ascii=False)
+                    else:
+                        # Write empty JSON object for completely empty file
+                        f.write('{}')
             
-            # Save case-sensitive settings
-            self.save_case_sensitive_settings(case_sensitive_settings)
+            # Save case-sensitive settings (skip the write if none of them changed)
+            if case_sensitive_settings != self._original_case_sensitive:
+                self.save_case_sensitive_settings(case_sensitive_settings)
             
             # Update the game_text_reader's game_units
             self.game_text_reader.game_units = new_units
@@ -598,6 +739,9 @@ class GameUnitsEditWindow:
             # Show success message
             messagebox.showinfo("Success", "Game units saved successfully!")
             
+            # Release the preview speaker
+            self.current_speaker = None
+            
             # Unregister this window and clean up reference in game_text_reader
             self.game_text_reader.unregister_hotkey_disabling_window("Gamer Units")
             if hasattr(self.game_text_reader, '_game_units_editor'):
@@ -612,21 +756,10 @@ class GameUnitsEditWindow:
     
     def cancel_edit(self):
         """Cancel editing and close the window."""
-        # Check if there are unsaved changes
-        current_units = {}
-        current_case_sensitive = {}
-        for short_name_var, full_name_var, case_sensitive_var, short_entry, full_entry, case_frame, case_checkbox, listen_btn, delete_btn, default_btn, row_frame in self.entry_widgets:
-            short_name = short_name_var.get().strip()
-            full_name = full_name_var.get().strip()
-            case_sensitive = case_sensitive_var.get()
-            if short_name and full_name:
-                current_units[short_name] = full_name
-                current_case_sensitive[short_name] = case_sensitive
-        
-        # Load original case-sensitive settings for comparison
-        original_case_sensitive = self.load_case_sensitive_settings()
-        
-        if current_units != self.original_units or current_case_sensitive != original_case_sensitive:
+        # Only compare the rows if something was edited
+        if not self._dirty:
+            self._cancel_pending_rows()
+        elif self._has_unsaved_changes():
             if messagebox.askyesno("Unsaved Changes", "You have unsaved changes. Are you sure you want to cancel?"):
                 # User clicked Yes - proceed with cancel
                 pass
@@ -634,8 +767,9 @@ class GameUnitsEditWindow:
                 # User clicked No - don't cancel, return to the window
                 return
         
-        # Stop any speech
+        # Stop any speech and release the preview speaker
         self.stop_speech()
+        self.current_speaker = None
         
         # Unregister this window and clean up reference in game_text_reader
         self.game_text_reader.unregister_hotkey_disabling_window("Gamer Units")
@@ -644,4 +778,19 @@ class GameUnitsEditWindow:
         
         # Close the window
         self.window.destroy()
+    
+    def _has_unsaved_changes(self):
+        """Whether the rows differ from the units and case-sensitive settings loaded at open."""
+        self._finish_pending_rows()
+        current_units = {}
+        current_case_sensitive = {}
+        for row in self.entry_widgets:
+            short_name = row.short_entry.get().strip()
+            full_name = row.full_entry.get().strip()
+            case_sensitive = row.case_sensitive_var.get()
+            if short_name and full_name:
+                current_units[short_name] = full_name
+                current_case_sensitive[short_name] = case_sensitive
+        
+        return current_units != self.original_units or current_case_sensitive != self._original_case_sensitive
 